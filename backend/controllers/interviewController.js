@@ -88,6 +88,96 @@ exports.submitAnswer = async (req, res) => {
     }
 };
 
+// Start live evaluation of an answer being typed
+exports.startLiveAnswer = async (req, res) => {
+    try {
+        const { interviewId, questionIndex, delta } = req.body;
+
+        const interview = await Interview.findOne({
+            _id: interviewId,
+            userId: req.user._id,
+        });
+
+        if (!interview) {
+            return res.status(404).json({ message: 'Interview not found' });
+        }
+
+        if (questionIndex >= interview.questions.length) {
+            return res.status(400).json({ message: 'Invalid question index' });
+        }
+
+        const question = interview.questions[questionIndex].question;
+        const session = await mlService.startAnswerSession(
+            question, interview.role, delta || '', req.user._id.toString()
+        );
+
+        res.status(201).json(session);
+    } catch (error) {
+        console.error('Start live answer error:', error);
+        res.status(500).json({ message: 'Failed to start live evaluation', error: error.message });
+    }
+};
+
+// Append text to a live answer
+exports.appendLiveAnswer = async (req, res) => {
+    try {
+        const { delta, offset, truncate } = req.body;
+
+        const evaluation = await mlService.appendAnswerSession(
+            req.params.sessionId, delta || '', offset, truncate, req.user._id.toString()
+        );
+
+        res.json(evaluation);
+    } catch (error) {
+        if ([400, 404, 409].includes(error.status)) {
+            return res.status(error.status).json({
+                message: error.data?.error || error.message,
+                offset: error.data?.offset,
+            });
+        }
+        console.error('Append live answer error:', error);
+        res.status(500).json({ message: 'Failed to update live evaluation', error: error.message });
+    }
+};
+
+// Stream live evaluation updates as server-sent events
+exports.streamLiveAnswer = async (req, res) => {
+    try {
+        const stream = await mlService.streamAnswerSession(req.params.sessionId, req.user._id.toString());
+
+        res.set({
+            'Content-Type': 'text/event-stream',
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',
+        });
+        res.flushHeaders();
+
+        stream.on('error', () => res.end());
+        stream.pipe(res);
+        req.on('close', () => stream.destroy());
+    } catch (error) {
+        if (error.status === 404) {
+            return res.status(404).json({ message: 'Session not found' });
+        }
+        console.error('Stream live answer error:', error);
+        res.status(500).json({ message: 'Failed to stream live evaluation' });
+    }
+};
+
+// Close a live answer session
+exports.closeLiveAnswer = async (req, res) => {
+    try {
+        const evaluation = await mlService.closeAnswerSession(req.params.sessionId, req.user._id.toString());
+        res.json(evaluation);
+    } catch (error) {
+        if (error.status === 404) {
+            return res.status(404).json({ message: 'Session not found' });
+        }
+        console.error('Close live answer error:', error);
+        res.status(500).json({ message: 'Failed to close live evaluation' });
+    }
+};
+
 // Get interview result
 exports.getInterviewResult = async (req, res) => {
     try {
@@ -12,6 +12,12 @@ router.post('/start', interviewController.startInterview);
 // Submit answer
 router.post('/answer', interviewController.submitAnswer);
 
+// Live answer evaluation
+router.post('/live', interviewController.startLiveAnswer);
+router.post('/live/:sessionId', interviewController.appendLiveAnswer);
+router.get('/live/:sessionId/events', interviewController.streamLiveAnswer);
+router.delete('/live/:sessionId', interviewController.closeLiveAnswer);
+
 // Get interview result
 router.get('/result/:id', interviewController.getInterviewResult);
 
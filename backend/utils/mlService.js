@@ -3,14 +3,17 @@ const axios = require('axios');
 const ML_SERVICE_URL = process.env.ML_SERVICE_URL || 'http://localhost:8000';
 
 const mlService = {
-    // Parse resume file
-    parseResume: async (filepath) => {
+    // Parse resume file (optionally only a subset of fields, e.g. ['skills'])
+    parseResume: async (filepath, fields) => {
         try {
             const FormData = require('form-data');
             const fs = require('fs');
 
             const formData = new FormData();
             formData.append('file', fs.createReadStream(filepath));
+            if (fields && fields.length) {
+                formData.append('fields', fields.join(','));
+            }
 
             const response = await axios.post(`${ML_SERVICE_URL}/ml/parse-resume`, formData, {
                 headers: formData.getHeaders(),
@@ -69,6 +72,74 @@ const mlService = {
         }
     },
 
+    // Start a live evaluation session for an answer being typed
+    startAnswerSession: async (question, role, delta, owner) => {
+        try {
+            const response = await axios.post(`${ML_SERVICE_URL}/ml/evaluate-answer/session`, {
+                question,
+                role,
+                delta,
+            }, { params: { owner } });
+
+            return response.data;
+        } catch (error) {
+            console.error('ML Service - Start Answer Session Error:', error.message);
+            throw new Error('Failed to start answer session');
+        }
+    },
+
+    // Append text at `offset` of a live answer, first cutting it back to `truncate` if given
+    appendAnswerSession: async (sessionId, delta, offset, truncate, owner) => {
+        try {
+            const response = await axios.post(`${ML_SERVICE_URL}/ml/evaluate-answer/session/${sessionId}`, {
+                delta,
+                offset,
+                truncate,
+            }, { params: { owner } });
+
+            return response.data;
+        } catch (error) {
+            console.error('ML Service - Append Answer Session Error:', error.message);
+            const err = new Error('Failed to update answer session');
+            err.status = error.response?.status;
+            err.data = error.response?.data;
+            throw err;
+        }
+    },
+
+    // Open the server-sent event stream of a live answer
+    streamAnswerSession: async (sessionId, owner) => {
+        try {
+            const response = await axios.get(`${ML_SERVICE_URL}/ml/evaluate-answer/session/${sessionId}/events`, {
+                params: { owner },
+                responseType: 'stream',
+            });
+
+            return response.data;
+        } catch (error) {
+            console.error('ML Service - Stream Answer Session Error:', error.message);
+            const err = new Error('Failed to stream answer session');
+            err.status = error.response?.status;
+            throw err;
+        }
+    },
+
+    // Close a live answer session
+    closeAnswerSession: async (sessionId, owner) => {
+        try {
+            const response = await axios.delete(`${ML_SERVICE_URL}/ml/evaluate-answer/session/${sessionId}`, {
+                params: { owner },
+            });
+
+            return response.data;
+        } catch (error) {
+            console.error('ML Service - Close Answer Session Error:', error.message);
+            const err = new Error('Failed to close answer session');
+            err.status = error.response?.status;
+            throw err;
+        }
+    },
+
     // Classify role based on skills
     classifyRole: async (skills) => {
         try {
@@ -1,7 +1,10 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import api from '../services/api';
-import { MessageCircle, Send, CheckCircle } from 'lucide-react';
+import { MessageCircle, Send, CheckCircle, Activity } from 'lucide-react';
+
+// Delay after the last keystroke before sending new text for live evaluation
+const LIVE_SYNC_DELAY = 400;
 
 const MockInterview = () => {
     const { id } = useParams();
@@ -11,11 +14,23 @@ const MockInterview = () => {
     const [answer, setAnswer] = useState('');
     const [submitting, setSubmitting] = useState(false);
     const [loading, setLoading] = useState(true);
+    const [liveEvaluation, setLiveEvaluation] = useState(null);
+
+    // Live evaluation session: { id, sent, controller }, where `sent` is the
+    // text the ML service has already scored
+    const liveSessionRef = useRef(null);
+    const liveGenerationRef = useRef(0);
+    const liveSyncRef = useRef(Promise.resolve());
+    const liveTimerRef = useRef(null);
+    const answerRef = useRef('');
 
     useEffect(() => {
         fetchInterview();
     }, [id]);
 
+    // Close the live session when moving to another question or leaving the page
+    useEffect(() => () => closeLiveSession(), [currentQuestionIndex]);
+
     const fetchInterview = async () => {
         try {
             const response = await api.get(`/interview/result/${id}`);
@@ -33,9 +48,142 @@ const MockInterview = () => {
         }
     };
 
+    const openLiveStream = async (session) => {
+        const controller = new AbortController();
+        session.controller = controller;
+
+        try {
+            const response = await fetch(`${api.defaults.baseURL}/interview/live/${session.id}/events`, {
+                headers: { Authorization: `Bearer ${localStorage.getItem('token')}` },
+                signal: controller.signal,
+            });
+            if (!response.ok) return;
+
+            const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+            let buffer = '';
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+
+                buffer += value;
+                const events = buffer.split('\n\n');
+                buffer = events.pop();
+
+                for (const event of events) {
+                    const lines = event.split('\n');
+                    const data = lines.find(line => line.startsWith('data: '));
+                    if (lines.includes('event: evaluation') && data && liveSessionRef.current === session) {
+                        setLiveEvaluation(JSON.parse(data.slice(6)));
+                    }
+                }
+            }
+        } catch (error) {
+            if (error.name !== 'AbortError') {
+                console.error('Live evaluation stream failed:', error);
+            }
+        }
+    };
+
+    // Close the current session; resolves once the ML service has released it
+    const dropLiveSession = () => {
+        const session = liveSessionRef.current;
+        liveSessionRef.current = null;
+
+        if (!session) return Promise.resolve();
+
+        session.controller?.abort();
+        return api.delete(`/interview/live/${session.id}`).catch(() => {});
+    };
+
+    // Stop live evaluation for the current question; pending syncs are discarded
+    const closeLiveSession = () => {
+        liveGenerationRef.current += 1;
+        clearTimeout(liveTimerRef.current);
+        const closed = dropLiveSession();
+        setLiveEvaluation(null);
+
+        // Later syncs wait for the close so sessions are never left open behind them
+        liveSyncRef.current = liveSyncRef.current.then(() => closed);
+    };
+
+    const startLiveSession = async (text, questionIndex, generation) => {
+        const response = await api.post('/interview/live', {
+            interviewId: id,
+            questionIndex,
+            delta: text,
+        });
+
+        // The question changed or the answer was submitted while starting
+        if (generation !== liveGenerationRef.current) {
+            await api.delete(`/interview/live/${response.data.sessionId}`).catch(() => {});
+            return;
+        }
+
+        const session = { id: response.data.sessionId, sent: text };
+        liveSessionRef.current = session;
+        setLiveEvaluation(response.data);
+        openLiveStream(session);
+    };
+
+    const syncLiveAnswer = async (questionIndex, generation) => {
+        if (generation !== liveGenerationRef.current) return;
+
+        const text = answerRef.current;
+        const session = liveSessionRef.current;
+
+        if (!session) {
+            if (text.trim()) {
+                await startLiveSession(text, questionIndex, generation);
+            }
+            return;
+        }
+
+        if (text === session.sent) return;
+
+        // Keep the common prefix; anything after it was edited or deleted.
+        // Offsets are string indices, i.e. UTF-16 code units, as on the server.
+        let prefix = 0;
+        const limit = Math.min(text.length, session.sent.length);
+        while (prefix < limit && text[prefix] === session.sent[prefix]) prefix++;
+        if (prefix > 0 && prefix < limit && /[\uD800-\uDBFF]/.test(text[prefix - 1])) {
+            prefix--; // don't split a surrogate pair
+        }
+
+        try {
+            await api.post(`/interview/live/${session.id}`, {
+                delta: text.slice(prefix),
+                offset: session.sent.length,
+                truncate: prefix < session.sent.length ? prefix : undefined,
+            });
+            session.sent = text;
+        } catch (error) {
+            // Session expired or out of sync: start over with the full answer
+            if ([404, 409].includes(error.response?.status) && generation === liveGenerationRef.current) {
+                await dropLiveSession();
+                await startLiveSession(text, questionIndex, generation);
+            }
+        }
+    };
+
+    const handleAnswerChange = (value) => {
+        setAnswer(value);
+        answerRef.current = value;
+
+        const questionIndex = currentQuestionIndex;
+        const generation = liveGenerationRef.current;
+        clearTimeout(liveTimerRef.current);
+        liveTimerRef.current = setTimeout(() => {
+            // Chain syncs so deltas reach the server in order
+            liveSyncRef.current = liveSyncRef.current
+                .then(() => syncLiveAnswer(questionIndex, generation))
+                .catch(error => console.error('Live evaluation failed:', error));
+        }, LIVE_SYNC_DELAY);
+    };
+
     const handleSubmitAnswer = async () => {
         if (!answer.trim()) return;
 
+        closeLiveSession();
         setSubmitting(true);
         try {
             await api.post('/interview/answer', {
@@ -48,6 +196,7 @@ const MockInterview = () => {
             if (currentQuestionIndex < interview.questions.length - 1) {
                 setCurrentQuestionIndex(currentQuestionIndex + 1);
                 setAnswer('');
+                answerRef.current = '';
                 await fetchInterview(); // Refresh to get evaluation
             } else {
                 // Interview complete
@@ -137,7 +286,7 @@ const MockInterview = () => {
                         </label>
                         <textarea
                             value={answer}
-                            onChange={(e) => setAnswer(e.target.value)}
+                            onChange={(e) => handleAnswerChange(e.target.value)}
                             placeholder="Type your answer here..."
                             rows={8}
                             className="input-field resize-none"
@@ -146,6 +295,28 @@ const MockInterview = () => {
                         <p className="text-sm text-gray-500 mt-2">
                             Take your time and provide a detailed answer
                         </p>
+
+                        {/* Live Feedback */}
+                        {liveEvaluation && (
+                            <div className="mt-4 p-4 bg-blue-50 border border-blue-200 rounded-lg">
+                                <div className="flex items-start space-x-2">
+                                    <Activity className="w-5 h-5 text-blue-600 flex-shrink-0 mt-0.5" />
+                                    <div>
+                                        <p className="text-sm font-medium text-blue-900 mb-1">
+                                            Live score: {liveEvaluation.score}%
+                                        </p>
+                                        <p className="text-sm text-blue-800">
+                                            {liveEvaluation.feedback}
+                                        </p>
+                                        {liveEvaluation.keywords?.length > 0 && (
+                                            <p className="text-xs text-blue-700 mt-1">
+                                                Key terms covered: {liveEvaluation.keywords.join(', ')}
+                                            </p>
+                                        )}
+                                    </div>
+                                </div>
+                            </div>
+                        )}
                     </div>
                 </div>
 
@@ -1,5 +1,10 @@
+import json
 import os
-from flask import Flask, request, jsonify
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
 from dotenv import load_dotenv
 from resume_parser import ResumeParser
@@ -19,6 +24,41 @@ job_matcher = JobMatcher()
 interview_evaluator = InterviewEvaluator()
 role_classifier = RoleClassifier()
 
+# Live answer sessions (session id -> AnswerSession), least recently used first.
+# Sessions live in this process only: run the ML service with a single worker
+# (threads are fine) or route a session's requests to the same worker.
+# Each open event stream holds a server thread, so streams are capped separately.
+answer_sessions = OrderedDict()
+answer_sessions_lock = threading.Lock()
+answer_streams = 0
+SESSION_TTL = int(os.getenv('ANSWER_SESSION_TTL', 900))
+MAX_ANSWER_SESSIONS = int(os.getenv('MAX_ANSWER_SESSIONS', 1000))
+MAX_ANSWER_STREAMS = int(os.getenv('MAX_ANSWER_STREAMS', 100))
+SESSION_HEARTBEAT = 15  # seconds between keep-alive comments on event streams
+
+def expire_answer_sessions():
+    """Drop live answer sessions that have been idle longer than SESSION_TTL"""
+    cutoff = time.monotonic() - SESSION_TTL
+    with answer_sessions_lock:
+        while answer_sessions:
+            session_id, session = next(iter(answer_sessions.items()))
+            if session.last_seen >= cutoff:
+                break
+            del answer_sessions[session_id]
+            session.close()
+
+def get_answer_session(session_id, owner=None):
+    """Look up a live answer session owned by `owner` and mark it as recently used"""
+    expire_answer_sessions()
+    with answer_sessions_lock:
+        session = answer_sessions.get(session_id)
+        if session is not None and session.owner != owner:
+            return None
+        if session is not None:
+            session.touch()
+            answer_sessions.move_to_end(session_id)
+        return session
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -35,19 +75,26 @@ def parse_resume():
         
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
+
+        # Optional comma-separated subset of fields, e.g. "skills,email"
+        fields = request.values.get('fields')
+        fields = [f.strip() for f in fields.split(',') if f.strip()] if fields else None
         
         # Save file temporarily
         temp_path = f'/tmp/{file.filename}'
         file.save(temp_path)
         
         # Parse resume
-        result = resume_parser.parse(temp_path)
-        
-        # Clean up temp file
         try:
-            os.remove(temp_path)
-        except:
-            pass
+            result = resume_parser.parse(temp_path, fields)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        finally:
+            # Clean up temp file
+            try:
+                os.remove(temp_path)
+            except:
+                pass
         
         return jsonify(result)
     
@@ -110,6 +157,130 @@ def evaluate_answer():
         print(f'Evaluate answer error: {e}')
         return jsonify({'error': str(e)}), 500
 
+@app.route('/ml/evaluate-answer/session', methods=['POST'])
+def start_answer_session():
+    """Start a live evaluation session for an answer that is still being typed"""
+    try:
+        data = request.json
+        question = data.get('question', '')
+        role = data.get('role', '')
+
+        if not question:
+            return jsonify({'error': 'Question is required'}), 400
+
+        expire_answer_sessions()
+
+        session = interview_evaluator.start_session(question, role, request.args.get('owner'))
+        session_id = uuid.uuid4().hex
+        with answer_sessions_lock:
+            if len(answer_sessions) >= MAX_ANSWER_SESSIONS:
+                return jsonify({'error': 'Too many live answer sessions'}), 503
+            answer_sessions[session_id] = session
+
+        result = session.feed(data.get('delta', ''))
+        return jsonify({'sessionId': session_id, 'offset': session.offset, **result})
+
+    except Exception as e:
+        print(f'Start answer session error: {e}')
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/ml/evaluate-answer/session/<session_id>', methods=['POST'])
+def update_answer_session(session_id):
+    """Append text at `offset` of a live answer and return the updated evaluation.
+
+    Offsets are in UTF-16 code units. An optional `truncate` first cuts the
+    answer back to that offset, for edits that are not plain appends.
+    """
+    try:
+        data = request.json
+        delta = data.get('delta', '')
+        offset = data.get('offset')
+        truncate = data.get('truncate')
+
+        if not isinstance(offset, int):
+            return jsonify({'error': 'Offset is required'}), 400
+
+        if truncate is not None and not (isinstance(truncate, int) and 0 <= truncate <= offset):
+            return jsonify({'error': 'Truncate must be between 0 and offset'}), 400
+
+        session = get_answer_session(session_id, request.args.get('owner'))
+        if session is None:
+            return jsonify({'error': 'Session not found'}), 404
+
+        with session.lock:
+            if offset != session.offset:
+                return jsonify({'error': 'Offset mismatch', 'offset': session.offset}), 409
+            result = session.feed(delta, truncate)
+            return jsonify({'sessionId': session_id, 'offset': session.offset, **result})
+
+    except Exception as e:
+        print(f'Update answer session error: {e}')
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/ml/evaluate-answer/session/<session_id>/events', methods=['GET'])
+def answer_session_events(session_id):
+    """Stream evaluation updates for a live answer as server-sent events"""
+    global answer_streams
+
+    session = get_answer_session(session_id, request.args.get('owner'))
+    if session is None:
+        return jsonify({'error': 'Session not found'}), 404
+
+    with answer_sessions_lock:
+        if answer_streams >= MAX_ANSWER_STREAMS:
+            return jsonify({'error': 'Too many live answer streams'}), 503
+        answer_streams += 1
+
+    def release_stream():
+        global answer_streams
+        with answer_sessions_lock:
+            answer_streams -= 1
+
+    def events():
+        version = None
+        while True:
+            version, result, closed = session.wait_for_update(version, SESSION_HEARTBEAT)
+            if result is None:
+                yield ': keep-alive\n\n'
+                continue
+
+            payload = {'sessionId': session_id, **result}
+            yield f'event: evaluation\ndata: {json.dumps(payload)}\n\n'
+            if closed:
+                yield 'event: close\ndata: {}\n\n'
+                return
+
+    response = Response(
+        stream_with_context(events()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+    response.call_on_close(release_stream)
+    return response
+
+@app.route('/ml/evaluate-answer/session/<session_id>', methods=['DELETE'])
+def end_answer_session(session_id):
+    """Close a live answer session and return the final evaluation"""
+    try:
+        expire_answer_sessions()
+
+        with answer_sessions_lock:
+            session = answer_sessions.get(session_id)
+            if session is not None and session.owner == request.args.get('owner'):
+                del answer_sessions[session_id]
+            else:
+                session = None
+
+        if session is None:
+            return jsonify({'error': 'Session not found'}), 404
+
+        session.close()
+        return jsonify({'sessionId': session_id, 'offset': session.offset, **session.result()})
+
+    except Exception as e:
+        print(f'End answer session error: {e}')
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/ml/classify-role', methods=['POST'])
 def classify_role():
     """Classify job role based on skills"""
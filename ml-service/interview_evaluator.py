@@ -2,6 +2,8 @@ import json
 import os
 import random
 import re
+import threading
+import time
 
 class InterviewEvaluator:
     def __init__(self):
@@ -109,6 +111,9 @@ class InterviewEvaluator:
                 'Explain blue-green deployment strategy.'
             ]
         }
+
+        # Keyword automata, built lazily per role
+        self.keyword_automata = {}
     
     def generate_questions(self, role, user_skills):
         """Generate interview questions based on role"""
@@ -141,15 +146,22 @@ class InterviewEvaluator:
             'totalQuestions': len(selected_questions)
         }
     
+    def _get_automaton(self, role):
+        """Build (once per role) the keyword automaton used for answer scoring"""
+        if role not in self.keyword_automata:
+            role_keywords = self.job_roles.get(role, {}).get('keywords', [])
+            self.keyword_automata[role] = KeywordAutomaton(role_keywords)
+        return self.keyword_automata[role]
+    
+    def start_session(self, question, role, owner=None):
+        """Start an incremental evaluation session for a live answer"""
+        return AnswerSession(question, role, self._get_automaton(role), owner)
+    
     def evaluate_answer(self, question, answer, role):
         """Evaluate user's answer"""
         
-        if not answer or len(answer.strip()) < 10:
-            return {
-                'score': 0,
-                'feedback': 'Answer is too short. Please provide more details.',
-                'keywords': []
-            }
+        if not answer or len(answer.strip()) < AnswerSession.MIN_LENGTH:
+            return too_short_evaluation()
         
         # Get role keywords
         role_keywords = self.job_roles.get(role, {}).get('keywords', [])
@@ -158,25 +170,222 @@ class InterviewEvaluator:
         answer_lower = answer.lower()
         found_keywords = [kw for kw in role_keywords if kw.lower() in answer_lower]
         
-        # Basic scoring
-        base_score = 40  # Base score for attempting
-        length_score = min(20, len(answer.split()) // 5)  # Up to 20 points for length
-        keyword_score = min(40, len(found_keywords) * 10)  # Up to 40 points for keywords
+        return score_answer(len(answer.split()), found_keywords)
+
+
+def too_short_evaluation():
+    """Evaluation returned for answers below the minimum length"""
+    return {
+        'score': 0,
+        'feedback': 'Answer is too short. Please provide more details.',
+        'keywords': []
+    }
+
+
+def score_answer(word_count, found_keywords):
+    """Score an answer from its word count and the role keywords it mentions"""
+    
+    # Basic scoring
+    base_score = 40  # Base score for attempting
+    length_score = min(20, word_count // 5)  # Up to 20 points for length
+    keyword_score = min(40, len(found_keywords) * 10)  # Up to 40 points for keywords
+    
+    total_score = base_score + length_score + keyword_score
+    
+    # Generate feedback
+    if total_score >= 80:
+        feedback = 'Excellent answer! You covered key concepts well and demonstrated strong understanding.'
+    elif total_score >= 60:
+        feedback = 'Good answer! Consider adding more specific examples or technical details.'
+    elif total_score >= 40:
+        feedback = 'Decent attempt. Try to include more relevant technical terms and elaborate on your points.'
+    else:
+        feedback = 'Your answer needs more depth. Focus on technical details and provide concrete examples.'
+    
+    return {
+        'score': min(100, total_score),
+        'feedback': feedback,
+        'keywords': found_keywords
+    }
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over lowercased role keywords.
+    
+    Matching is plain substring matching (same as `kw.lower() in answer`),
+    but the scan state can be carried across chunk boundaries.
+    """
+    
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        self.goto = [{}]
+        self.fail = [0]
+        self.outputs = [[]]
         
-        total_score = base_score + length_score + keyword_score
+        for index, keyword in enumerate(self.keywords):
+            node = 0
+            for char in keyword.lower():
+                if char not in self.goto[node]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.outputs.append([])
+                    self.goto[node][char] = len(self.goto) - 1
+                node = self.goto[node][char]
+            self.outputs[node].append(index)
         
-        # Generate feedback
-        if total_score >= 80:
-            feedback = 'Excellent answer! You covered key concepts well and demonstrated strong understanding.'
-        elif total_score >= 60:
-            feedback = 'Good answer! Consider adding more specific examples or technical details.'
-        elif total_score >= 40:
-            feedback = 'Decent attempt. Try to include more relevant technical terms and elaborate on your points.'
-        else:
-            feedback = 'Your answer needs more depth. Focus on technical details and provide concrete examples.'
+        # Breadth-first pass to fill in failure links
+        queue = list(self.goto[0].values())
+        for node in queue:
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                if self.fail[child] == child:
+                    self.fail[child] = 0
+                self.outputs[child] = self.outputs[child] + self.outputs[self.fail[child]]
+    
+    def scan(self, state, text, found):
+        """Advance from `state` over lowercased `text`, adding matches to `found`"""
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return state
+
+
+def utf16_length(text):
+    """Length of text in UTF-16 code units, the unit JavaScript strings use"""
+    return len(text.encode('utf-16-le', 'surrogatepass')) // 2
+
+
+def utf16_prefix(text, length):
+    """The first `length` UTF-16 code units of text"""
+    return text.encode('utf-16-le', 'surrogatepass')[:length * 2].decode('utf-16-le', 'surrogatepass')
+
+
+class AnswerSession:
+    """Incremental scoring state for an answer that arrives in chunks.
+    
+    Each call to `feed` costs O(len(delta)): the word count, the keyword
+    automaton state and the keywords found so far are all kept between
+    updates, so the full answer is never re-scanned. Every chunk keeps a
+    checkpoint of that state, so cutting the answer back only re-scans the
+    chunk the cut falls in.
+    """
+    
+    MIN_LENGTH = 10
+    
+    def __init__(self, question, role, automaton, owner=None):
+        self.question = question
+        self.role = role
+        self.automaton = automaton
+        self.owner = owner
+        self.state = 0
+        self.found = set()
+        self.word_count = 0
+        self.in_word = False
+        self.length = 0
+        self.offset = 0  # length in UTF-16 code units, as counted by clients
+        self.first_char = None  # offset of first non-whitespace char
+        self.last_char = None  # offset of last non-whitespace char
+        self.chunks = []  # (checkpoint before chunk, chunk text)
         
-        return {
-            'score': min(100, total_score),
-            'feedback': feedback,
-            'keywords': found_keywords
-        }
+        # Guards all of the above; notified on every update so event streams wake up
+        self.lock = threading.Condition()
+        self.version = 0
+        self.closed = False
+        self.last_seen = time.monotonic()
+    
+    def touch(self):
+        """Mark the session as active so it is not expired"""
+        self.last_seen = time.monotonic()
+    
+    def close(self):
+        """Close the session and wake any event streams waiting on it"""
+        with self.lock:
+            self.closed = True
+            self.lock.notify_all()
+    
+    def feed(self, delta, truncate=None):
+        """Consume the next chunk of the answer and return updated scores.
+        
+        If `truncate` is given, the answer is first cut back to that many
+        UTF-16 code units, so edits other than appends don't need a new session.
+        """
+        with self.lock:
+            if truncate is not None:
+                self._truncate(truncate)
+            self._append(delta)
+            
+            self.version += 1
+            self.lock.notify_all()
+            return self.result()
+    
+    def _checkpoint(self):
+        return (self.state, frozenset(self.found), self.word_count, self.in_word,
+                self.length, self.offset, self.first_char, self.last_char)
+    
+    def _restore(self, checkpoint):
+        (self.state, found, self.word_count, self.in_word,
+         self.length, self.offset, self.first_char, self.last_char) = checkpoint
+        self.found = set(found)
+    
+    def _append(self, delta):
+        if not delta:
+            return
+        
+        self.chunks.append((self._checkpoint(), delta))
+        self.state = self.automaton.scan(self.state, delta.lower(), self.found)
+        
+        stripped = delta.strip()
+        if stripped:
+            offset = self.length + (len(delta) - len(delta.lstrip()))
+            if self.first_char is None:
+                self.first_char = offset
+            self.last_char = offset + len(stripped) - 1
+            
+            words = len(delta.split())
+            if self.in_word and not delta[0].isspace():
+                words -= 1  # word continues across the chunk boundary
+            self.word_count += words
+        
+        self.in_word = not delta[-1].isspace()
+        self.length += len(delta)
+        self.offset += utf16_length(delta)
+    
+    def _truncate(self, offset):
+        while self.offset > offset:
+            checkpoint, delta = self.chunks.pop()
+            self._restore(checkpoint)
+            if self.offset < offset:
+                self._append(utf16_prefix(delta, offset - self.offset))
+    
+    def wait_for_update(self, seen_version, timeout):
+        """Block until the session changes after `seen_version` or is closed.
+        
+        Returns (version, result, closed); result is None on timeout and
+        otherwise includes the session's current `offset`.
+        """
+        with self.lock:
+            self.lock.wait_for(lambda: self.version != seen_version or self.closed, timeout)
+            if self.version == seen_version and not self.closed:
+                return seen_version, None, False
+            return self.version, dict(self.result(), offset=self.offset), self.closed
+    
+    def stripped_length(self):
+        if self.first_char is None:
+            return 0
+        return self.last_char - self.first_char + 1
+    
+    def result(self):
+        """Score the answer received so far"""
+        if self.stripped_length() < self.MIN_LENGTH:
+            return too_short_evaluation()
+        
+        found_keywords = [kw for i, kw in enumerate(self.automaton.keywords) if i in self.found]
+        return score_answer(self.word_count, found_keywords)
@@ -16,6 +16,8 @@ class ResumeParser:
             r'\b(?:REST API|GraphQL|Microservices|WebSocket)\b',
             r'\b(?:SQL|NoSQL|Database|ETL|Data Analysis)\b',
         ]
+        # Single pass over the text instead of one per pattern
+        self.skill_regex = re.compile('|'.join(self.skill_patterns), re.IGNORECASE)
         
     def extract_text_from_pdf(self, filepath):
         """Extract text from PDF file"""
@@ -58,8 +60,7 @@ class ResumeParser:
     
     def extract_name(self, text):
         """Extract name from first few lines (simple heuristic)"""
-        lines = text.split('\n')
-        for line in lines[:5]:
+        for line in iter_lines(text, 5):
             line = line.strip()
             # Simple check: if line has 2-4 words and no special chars
             if line and 2 <= len(line.split()) <= 4 and line.replace(' ', '').isalpha():
@@ -68,65 +69,139 @@ class ResumeParser:
     
     def extract_skills(self, text):
         """Extract skills using pattern matching"""
-        skills = set()
-        for pattern in self.skill_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            skills.update(matches)
+        skills = {match.group() for match in self.skill_regex.finditer(text)}
         return list(skills)
     
-    def parse(self, filepath):
-        """Main parsing function"""
-        text = self.extract_text(filepath)
-        
-        if not text:
-            return {
-                'extractedData': {
-                    'name': None,
-                    'email': None,
-                    'skills': [],
-                    'experience': 'Unable to extract text from resume'
-                },
-                'analysis': {
-                    'score': 0,
-                    'strengths': [],
-                    'improvements': ['Unable to parse resume. Please ensure it\'s a valid PDF or DOCX file.'],
-                    'missingSkills': []
-                }
+    def load(self, filepath):
+        """Extract text once and return a lazily-evaluated ParsedResume"""
+        return ParsedResume(self, self.extract_text(filepath))
+
+    def parse(self, filepath, fields=None):
+        """Main parsing function, optionally limited to a subset of FIELDS"""
+        ParsedResume.check_fields(fields)
+        return self.load(filepath).to_dict(fields)
+
+
+def iter_lines(text, limit):
+    """Yield up to `limit` lines of text by scanning newline offsets"""
+    start = 0
+    for _ in range(limit):
+        end = text.find('\n', start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+_UNSET = object()
+
+
+class ParsedResume:
+    """Resume text with fields that are extracted on first access"""
+
+    FIELDS = ('name', 'email', 'skills', 'experience', 'score', 'analysis')
+
+    __slots__ = ('parser', 'text', '_name', '_email', '_skills', '_analysis')
+
+    def __init__(self, parser, text):
+        self.parser = parser
+        self.text = text
+        self._name = _UNSET
+        self._email = _UNSET
+        self._skills = _UNSET
+        self._analysis = _UNSET
+
+    @property
+    def name(self):
+        if self._name is _UNSET:
+            self._name = self.parser.extract_name(self.text) if self.text else None
+        return self._name
+
+    @property
+    def email(self):
+        if self._email is _UNSET:
+            self._email = self.parser.extract_email(self.text) if self.text else None
+        return self._email
+
+    @property
+    def skills(self):
+        if self._skills is _UNSET:
+            self._skills = self.parser.extract_skills(self.text) if self.text else []
+        return self._skills
+
+    @property
+    def experience(self):
+        if not self.text:
+            return 'Unable to extract text from resume'
+        return self.text[:200] + '...' if len(self.text) > 200 else self.text
+
+    @property
+    def score(self):
+        if not self.text:
+            return 0
+        return min(100, len(self.skills) * 8 + 20)  # Simple scoring
+
+    @property
+    def analysis(self):
+        if self._analysis is not _UNSET:
+            return self._analysis
+
+        if not self.text:
+            self._analysis = {
+                'score': 0,
+                'strengths': [],
+                'improvements': ['Unable to parse resume. Please ensure it\'s a valid PDF or DOCX file.'],
+                'missingSkills': []
             }
-        
-        # Extract data
-        name = self.extract_name(text)
-        email = self.extract_email(text)
-        skills = self.extract_skills(text)
-        
-        # Basic analysis
-        score = min(100, len(skills) * 8 + 20)  # Simple scoring
-        
+            return self._analysis
+
+        skills = self.skills
+        email = self.email
+
         strengths = []
         if len(skills) >= 5:
             strengths.append(f"Strong technical skill set with {len(skills)} identified skills")
         if email:
             strengths.append("Contact information clearly provided")
-        
+
         improvements = []
         if len(skills) < 5:
             improvements.append("Consider adding more technical skills to your resume")
         if not email:
             improvements.append("Add contact email for better visibility")
-        if len(text) < 500:
+        if len(self.text) < 500:
             improvements.append("Resume appears brief. Consider adding more details about your experience")
-        
-        return {
-            'extractedData': {
-                'name': name,
-                'email': email,
-                'skills': skills,
-                'experience': text[:200] + '...' if len(text) > 200 else text
-            },
-            'analysis': {
-                'score': score,
-                'strengths': strengths,
-                'improvements': improvements,
-                'missingSkills': []
-            }
+
+        self._analysis = {
+            'score': self.score,
+            'strengths': strengths,
+            'improvements': improvements,
+            'missingSkills': []
         }
+        return self._analysis
+
+    @classmethod
+    def check_fields(cls, fields):
+        """Raise ValueError if `fields` is empty or names anything outside FIELDS"""
+        if fields is not None and not fields:
+            raise ValueError("No resume fields requested")
+        unknown = set(fields or ()) - set(cls.FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown resume fields: {', '.join(sorted(unknown))}")
+
+    def to_dict(self, fields=None):
+        """Build the API result, computing only the requested fields"""
+        if fields is None:
+            fields = self.FIELDS
+
+        extracted = {field: getattr(self, field)
+                     for field in ('name', 'email', 'skills', 'experience') if field in fields}
+        result = {'extractedData': extracted}
+
+        if 'analysis' in fields:
+            result['analysis'] = self.analysis
+        elif 'score' in fields:
+            result['analysis'] = {'score': self.score}
+
+        return result